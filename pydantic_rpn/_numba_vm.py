@@ -0,0 +1,132 @@
+"""
+Optional Numba-accelerated VM for float64 RPN programs.
+
+When numba is installed, run() is an njit-compiled interpreter over flat
+opcode/constant arrays; when it is not, run() is the same function in pure
+Python so the module stays importable and testable. Core only routes an
+expression here when every literal is a float and every operator has an
+opcode below, so float64 arithmetic is exact w.r.t. the generic interpreter.
+"""
+
+import math
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    numba = None
+    HAS_NUMBA = False
+
+# Opcodes: stack effects mirror the generic interpreter in core
+OP_CONST = 0   # push consts[arg]
+OP_VAR = 1     # push variables[arg]
+OP_ADD = 2
+OP_SUB = 3
+OP_MUL = 4
+OP_DIV = 5
+OP_FLOORDIV = 6
+OP_MOD = 7
+OP_POW = 8
+OP_MAX = 9
+OP_MIN = 10
+OP_NEG = 11
+OP_ABS = 12
+OP_SQRT = 13
+OP_SIN = 14
+OP_COS = 15
+OP_TAN = 16
+OP_LOG10 = 17
+OP_LN = 18
+OP_EXP = 19
+
+# Token -> opcode for operators this VM can execute
+BINARY_OPS = {
+    '+': OP_ADD,
+    '-': OP_SUB,
+    '*': OP_MUL,
+    '/': OP_DIV,
+    '//': OP_FLOORDIV,
+    '%': OP_MOD,
+    '**': OP_POW,
+    'pow': OP_POW,
+    'max': OP_MAX,
+    'min': OP_MIN,
+}
+UNARY_OPS = {
+    'neg': OP_NEG,
+    'abs': OP_ABS,
+    'sqrt': OP_SQRT,
+    'sin': OP_SIN,
+    'cos': OP_COS,
+    'tan': OP_TAN,
+    'log': OP_LOG10,
+    'ln': OP_LN,
+    'exp': OP_EXP,
+}
+
+
+def _run(code, args, consts, variables, stack):
+    """Interpret a flat float64 program; returns the top of stack."""
+    sp = 0
+    for i in range(len(code)):
+        op = code[i]
+        if op == OP_CONST:
+            stack[sp] = consts[args[i]]
+            sp += 1
+        elif op == OP_VAR:
+            stack[sp] = variables[args[i]]
+            sp += 1
+        elif op == OP_ADD:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1] + stack[sp]
+        elif op == OP_SUB:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1] - stack[sp]
+        elif op == OP_MUL:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1] * stack[sp]
+        elif op == OP_DIV:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1] / stack[sp]
+        elif op == OP_FLOORDIV:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1] // stack[sp]
+        elif op == OP_MOD:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1] % stack[sp]
+        elif op == OP_POW:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1] ** stack[sp]
+        elif op == OP_MAX:
+            sp -= 1
+            if stack[sp] > stack[sp - 1]:
+                stack[sp - 1] = stack[sp]
+        elif op == OP_MIN:
+            sp -= 1
+            if stack[sp] < stack[sp - 1]:
+                stack[sp - 1] = stack[sp]
+        elif op == OP_NEG:
+            stack[sp - 1] = -stack[sp - 1]
+        elif op == OP_ABS:
+            stack[sp - 1] = abs(stack[sp - 1])
+        elif op == OP_SQRT:
+            stack[sp - 1] = math.sqrt(stack[sp - 1])
+        elif op == OP_SIN:
+            stack[sp - 1] = math.sin(stack[sp - 1])
+        elif op == OP_COS:
+            stack[sp - 1] = math.cos(stack[sp - 1])
+        elif op == OP_TAN:
+            stack[sp - 1] = math.tan(stack[sp - 1])
+        elif op == OP_LOG10:
+            stack[sp - 1] = math.log10(stack[sp - 1])
+        elif op == OP_LN:
+            stack[sp - 1] = math.log(stack[sp - 1])
+        elif op == OP_EXP:
+            stack[sp - 1] = math.exp(stack[sp - 1])
+    return stack[sp - 1]
+
+
+if HAS_NUMBA:
+    run = numba.njit(cache=True)(_run)
+else:
+    run = _run
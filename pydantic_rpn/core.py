@@ -1,13 +1,20 @@
 """Core RPN implementation with delightful developer experience."""
 
 import json
+import keyword
 import math
 import operator
+import os
 import re
+import sys
+from collections import ChainMap
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 from pydantic import BaseModel, Field, validator
 from pydantic.types import StrictFloat, StrictInt
 
+from . import _numba_vm
+
 
 class RPNError(Exception):
     """Base exception for RPN-related errors."""
@@ -24,6 +31,721 @@ class EvaluationError(RPNError):
     pass
 
 
+# Shared empty context for eval() calls with no defaults and no variables
+_EMPTY_DICT: Dict[str, Any] = {}
+
+
+def _cache_size() -> int:
+    """Cache budget from PYDANTIC_RPN_CACHE_SIZE, read at import time.
+
+    lru_cache fixes maxsize at decoration, so this is an import-time knob
+    rather than a runtime one. The default of 128 keeps total retained
+    cache memory under the ~100KB budget the memory tests enforce; memory-
+    tight deployments can lower it, batch jobs that churn through many
+    distinct expressions can raise it.
+    """
+    try:
+        size = int(os.environ.get('PYDANTIC_RPN_CACHE_SIZE', 128))
+    except ValueError:
+        return 128
+    return max(size, 1)
+
+
+_CACHE_SIZE = _cache_size()
+
+# Operators taking a single operand (everything else is binary)
+_UNARY_OPS = frozenset({
+    'not', 'abs', 'neg', 'sqrt', 'sin', 'cos', 'tan',
+    'log', 'ln', 'exp', 'ceil', 'floor', 'round',
+})
+
+
+# Built-in operators, bound to C-implemented callables from the operator and
+# math modules. Materialized once at import; pydantic would otherwise copy
+# class-level dicts into every instance as private attribute defaults.
+_OPERATORS: Dict[str, Callable] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '//': operator.floordiv,
+    '%': operator.mod,
+    '**': operator.pow,
+    'pow': operator.pow,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+    'and': operator.and_,
+    'or': operator.or_,
+    'not': operator.not_,
+    'abs': abs,
+    'neg': operator.neg,
+    'sqrt': math.sqrt,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'log': math.log10,
+    'ln': math.log,
+    'exp': math.exp,
+    'ceil': math.ceil,
+    'floor': math.floor,
+    'round': round,
+    'max': max,
+    'min': min,
+}
+
+# Stack operations - these should fail if insufficient items
+_STACK_OPS: Dict[str, Callable] = {
+    'dup': lambda stack: stack + [stack[-1]] if len(stack) >= 1 else (_ for _ in ()).throw(EvaluationError("dup requires at least 1 item on stack")),
+    'drop': lambda stack: stack[:-1] if len(stack) >= 1 else (_ for _ in ()).throw(EvaluationError("drop requires at least 1 item on stack")),
+    'swap': lambda stack: stack[:-2] + [stack[-1], stack[-2]] if len(stack) >= 2 else (_ for _ in ()).throw(EvaluationError("swap requires at least 2 items on stack")),
+    'rot': lambda stack: stack[:-3] + [stack[-2], stack[-1], stack[-3]] if len(stack) >= 3 else (_ for _ in ()).throw(EvaluationError("rot requires at least 3 items on stack")),
+    'over': lambda stack: stack + [stack[-2]] if len(stack) >= 2 else (_ for _ in ()).throw(EvaluationError("over requires at least 2 items on stack")),
+}
+
+# In-place stack-op handlers used by the compiled interpreter. Unlike the
+# _STACK_OPS lambdas (which build a new list), these mutate the eval stack
+# with append/slice assignment; error messages are identical.
+def _stack_dup(stack: list) -> None:
+    if not stack:
+        raise EvaluationError("dup requires at least 1 item on stack")
+    stack.append(stack[-1])
+
+
+def _stack_drop(stack: list) -> None:
+    if not stack:
+        raise EvaluationError("drop requires at least 1 item on stack")
+    del stack[-1]
+
+
+def _stack_swap(stack: list) -> None:
+    if len(stack) < 2:
+        raise EvaluationError("swap requires at least 2 items on stack")
+    stack[-1], stack[-2] = stack[-2], stack[-1]
+
+
+def _stack_rot(stack: list) -> None:
+    if len(stack) < 3:
+        raise EvaluationError("rot requires at least 3 items on stack")
+    stack[-3:] = stack[-2], stack[-1], stack[-3]
+
+
+def _stack_over(stack: list) -> None:
+    if len(stack) < 2:
+        raise EvaluationError("over requires at least 2 items on stack")
+    stack.append(stack[-2])
+
+
+_STACK_OPS_INPLACE: Dict[str, Callable[[list], None]] = {
+    'dup': _stack_dup,
+    'drop': _stack_drop,
+    'swap': _stack_swap,
+    'rot': _stack_rot,
+    'over': _stack_over,
+}
+
+# Constants
+_CONSTANTS: Dict[str, Union[int, float, bool]] = {
+    'pi': math.pi,
+    'e': math.e,
+    'tau': math.tau,
+    'inf': math.inf,
+    'true': True,
+    'false': False,
+}
+
+# Step kinds for the compiled program (see RPN._compile). _OP_BINARY_CONST
+# is a fused push-literal-then-binary-op super-instruction; its payload is
+# the (operator, literal) pair.
+(_OP_PUSH, _OP_BINARY, _OP_UNARY, _OP_STACK, _OP_NAME,
+ _OP_BINARY_CONST) = range(6)
+
+# Symbolic-stack marker for values not known at compile time
+_UNKNOWN = object()
+
+# Source templates for lowering operators to Python expressions. 'and'/'or'
+# lower to the bitwise forms to match operator.and_/or_ (no short-circuit).
+_CODEGEN_BINARY = {
+    '+': '({0} + {1})',
+    '-': '({0} - {1})',
+    '*': '({0} * {1})',
+    '/': '({0} / {1})',
+    '//': '({0} // {1})',
+    '%': '({0} % {1})',
+    '**': '({0} ** {1})',
+    'pow': '({0} ** {1})',
+    '==': '({0} == {1})',
+    '!=': '({0} != {1})',
+    '<': '({0} < {1})',
+    '>': '({0} > {1})',
+    '<=': '({0} <= {1})',
+    '>=': '({0} >= {1})',
+    'and': '({0} & {1})',
+    'or': '({0} | {1})',
+    'max': 'max({0}, {1})',
+    'min': 'min({0}, {1})',
+}
+_CODEGEN_UNARY = {
+    'not': '(not {0})',
+    'neg': '(-{0})',
+    'abs': 'abs({0})',
+    'sqrt': 'sqrt({0})',
+    'sin': 'sin({0})',
+    'cos': 'cos({0})',
+    'tan': 'tan({0})',
+    'log': 'log10({0})',
+    'ln': 'log({0})',
+    'exp': 'exp({0})',
+    'ceil': 'ceil({0})',
+    'floor': 'floor({0})',
+    'round': 'round({0})',
+}
+
+# Globals for generated code: just the functions the templates reference
+_CODEGEN_GLOBALS = {
+    '__builtins__': {},
+    'abs': abs,
+    'round': round,
+    'max': max,
+    'min': min,
+    'sqrt': math.sqrt,
+    'hypot': math.hypot,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'log10': math.log10,
+    'log': math.log,
+    'exp': math.exp,
+    'ceil': math.ceil,
+    'floor': math.floor,
+}
+
+# Reusable evaluation-stack buffers for the fixed-depth interpreter. Slots
+# only ever hold numbers and the stack-pointer discipline writes a slot
+# before reading it, so buffers are returned without clearing (clearing
+# measured 2.5x slower than allocating fresh; uncleared reuse beats both).
+_STACK_POOL: List[list] = []
+_STACK_POOL_MAX = 32
+
+# NumPy overrides for the operator table, built on first eval_batch() call
+_NUMPY_OPS: Optional[Dict[str, Callable]] = None
+
+
+def _numpy_operators(np) -> Dict[str, Callable]:
+    """Operator table with math functions swapped for NumPy ufuncs."""
+    global _NUMPY_OPS
+    if _NUMPY_OPS is None:
+        _NUMPY_OPS = {
+            **_OPERATORS,
+            'abs': np.abs,
+            'sqrt': np.sqrt,
+            'sin': np.sin,
+            'cos': np.cos,
+            'tan': np.tan,
+            'log': np.log10,
+            'ln': np.log,
+            'exp': np.exp,
+            'ceil': np.ceil,
+            'floor': np.floor,
+            'round': np.round,
+            'max': np.maximum,
+            'min': np.minimum,
+            'not': np.logical_not,
+        }
+    return _NUMPY_OPS
+
+
+def _peephole(program):
+    """
+    Pattern-replacement pass over compiled steps.
+
+    Recognizes the Pythagorean idiom 'x dup * y dup * + sqrt' and fuses it
+    into a single math.hypot call: three steps instead of eight, no stack
+    ops (so the fused program qualifies for the fast interpreters), and
+    better numerical behavior near overflow. math.fsum for '+' runs was
+    considered and rejected: it returns float and would silently change
+    exact integer sums.
+    """
+    out = []
+    i = 0
+    n = len(program)
+    while i < n:
+        if i + 8 <= n:
+            s0, s1, s2, s3, s4, s5, s6, s7 = program[i:i + 8]
+            if (s0[0] in (_OP_PUSH, _OP_NAME) and s3[0] in (_OP_PUSH, _OP_NAME)
+                    and s1[0] == _OP_STACK and s1[2] == 'dup'
+                    and s4[0] == _OP_STACK and s4[2] == 'dup'
+                    and s2[0] == _OP_BINARY and s2[2] == '*'
+                    and s5[0] == _OP_BINARY and s5[2] == '*'
+                    and s6[0] == _OP_BINARY and s6[2] == '+'
+                    and s7[0] == _OP_UNARY and s7[2] == 'sqrt'):
+                out.append(s0)
+                out.append(s3)
+                out.append((_OP_BINARY, math.hypot, 'sqrt'))
+                i += 8
+                continue
+        out.append(program[i])
+        i += 1
+    return out
+
+
+def _fold_program(program):
+    """
+    Constant-fold a compiled program.
+
+    Runs a symbolic interpretation over the steps: when an operator's
+    operands are all literals, the operator is executed at compile time and
+    the three steps collapse into a single push of the result. Operators
+    that raise on their constant operands (e.g. '5 0 /') are left symbolic
+    so the error still surfaces at eval() with the usual wrapping. Folding
+    only touches the compiled form -- the public token list is unchanged.
+    """
+    out = []
+    # Parallel stack of literal values (or _UNKNOWN). Invariant: the top
+    # k literal entries always correspond to the last k steps in `out`,
+    # each a single _OP_PUSH, which is what lets us splice them out.
+    sym = []
+
+    for step in program:
+        kind, payload, token = step
+        if kind == _OP_PUSH:
+            out.append(step)
+            sym.append(payload)
+        elif kind == _OP_BINARY:
+            if len(sym) >= 2 and sym[-1] is not _UNKNOWN and sym[-2] is not _UNKNOWN:
+                try:
+                    result = payload(sym[-2], sym[-1])
+                except Exception:
+                    pass  # Leave symbolic; fails identically at eval time
+                else:
+                    del sym[-2:], out[-2:]
+                    out.append((_OP_PUSH, result, result))
+                    sym.append(result)
+                    continue
+            out.append(step)
+            del sym[-2:]
+            sym.append(_UNKNOWN)
+        elif kind == _OP_UNARY:
+            if sym and sym[-1] is not _UNKNOWN:
+                try:
+                    result = payload(sym[-1])
+                except Exception:
+                    pass
+                else:
+                    del sym[-1], out[-1]
+                    out.append((_OP_PUSH, result, result))
+                    sym.append(result)
+                    continue
+            out.append(step)
+            del sym[-1:]
+            sym.append(_UNKNOWN)
+        else:
+            # Names resolve at eval time; stack ops rearrange unknown depths.
+            # Anything currently on the symbolic stack stops being foldable.
+            out.append(step)
+            if kind == _OP_NAME:
+                sym = [_UNKNOWN] * (len(sym) + 1)
+            elif token in ('dup', 'over'):
+                sym = [_UNKNOWN] * (len(sym) + 1)
+            elif token == 'drop':
+                sym = [_UNKNOWN] * max(len(sym) - 1, 0)
+            else:  # swap, rot
+                sym = [_UNKNOWN] * len(sym)
+
+    return tuple(out)
+
+
+def _square(x, _exp):
+    """Strength-reduced 'x 2 **': one multiply instead of a pow call."""
+    return x * x
+
+
+def _fuse_binary_const(program):
+    """
+    Fuse each literal push directly followed by a binary op into one
+    _OP_BINARY_CONST step ('x 2 *', 'tip +', 'x 2 **'...). A push right
+    before a binary op is always its top operand, so the pair collapses to
+    in-place arithmetic on the current stack top: one dispatch instead of
+    two and no intermediate stack slot. Runs after constant folding, so
+    any surviving pair has a non-constant left operand (or an op that
+    raised at fold time and must keep failing identically at eval time).
+    """
+    out = []
+    i = 0
+    n = len(program)
+    while i < n:
+        step = program[i]
+        if (step[0] == _OP_PUSH and i + 1 < n
+                and program[i + 1][0] == _OP_BINARY):
+            _kind, func, token = program[i + 1]
+            const = step[1]
+            # Strength reduction: squaring via '**'/'pow' becomes a
+            # multiply. Only for the exact int 2 -- a 2.0 exponent
+            # coerces an int base to float, which x*x would not.
+            if func is operator.pow and const.__class__ is int and const == 2:
+                func = _square
+            out.append((_OP_BINARY_CONST, (func, const), token))
+            i += 2
+        else:
+            out.append(step)
+            i += 1
+    return out
+
+
+def _static_stack_depth(program) -> Optional[int]:
+    """
+    Return the maximum stack depth of a program, or None if it cannot be
+    proven safe statically.
+
+    Programs containing stack ops (which replace the stack wholesale) or
+    that would underflow are not analyzable; those run on the generic
+    interpreter, which reports the underflow properly at eval time.
+    """
+    depth = max_depth = 0
+    for kind, _payload, _token in program:
+        if kind == _OP_STACK:
+            return None
+        if kind == _OP_BINARY:
+            if depth < 2:
+                return None
+            depth -= 1
+        elif kind in (_OP_UNARY, _OP_BINARY_CONST):
+            # Net-zero stack effect; the fused form never materializes
+            # its literal operand
+            if depth < 1:
+                return None
+        else:
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+    return max_depth
+
+
+def _codegen_source(program, cse: bool = False):
+    """
+    Lower a program to Python expression source, or None.
+
+    Runs the symbolic-stack translation (same idea as to_infix, but to
+    Python source): 'x 2 * y +' becomes '((x * 2) + y)'. Programs with
+    stack ops, unknown operators, names that aren't plain identifiers,
+    or that don't reduce to exactly one result stay on the interpreter.
+
+    With cse=True, lowers to SSA form instead: every op result becomes a
+    temp assignment line, memoized by its expression text so structurally
+    identical subexpressions ('subtotal tax_rate *' computed twice)
+    collapse into a single temp computed once. Returns (lines, result)
+    in that mode -- statements need a function body, so only jit() uses
+    it; the eval() code object stays a single expression.
+    """
+    stack = []
+    lines: List[str] = []
+    memo: Dict[str, str] = {}
+
+    def _result(expr):
+        if not cse:
+            return expr
+        name = memo.get(expr)
+        if name is None:
+            name = f'_t{len(memo)}'
+            memo[expr] = name
+            lines.append(f'{name} = {expr}')
+        return name
+
+    for kind, payload, token in program:
+        if kind == _OP_PUSH:
+            stack.append(f'({payload!r})')
+        elif kind == _OP_BINARY:
+            template = ('hypot({0}, {1})' if payload is math.hypot
+                        else _CODEGEN_BINARY.get(token))
+            if template is None or len(stack) < 2:
+                return None
+            right = stack.pop()
+            left = stack.pop()
+            stack.append(_result(template.format(left, right)))
+        elif kind == _OP_UNARY:
+            template = _CODEGEN_UNARY.get(token)
+            if template is None or not stack:
+                return None
+            stack.append(_result(template.format(stack.pop())))
+        elif kind == _OP_NAME:
+            if not token.isidentifier() or keyword.iskeyword(token):
+                return None
+            if cse and token.startswith('_t') and token[2:].isdigit():
+                # A variable spelled like a CSE temp would be shadowed by
+                # the generated assignments
+                return None
+            stack.append(token)
+        elif kind == _OP_BINARY_CONST:
+            func, const = payload
+            template = ('hypot({0}, {1})' if func is math.hypot
+                        else _CODEGEN_BINARY.get(token))
+            if template is None or not stack:
+                return None
+            stack.append(_result(template.format(stack.pop(), f'({const!r})')))
+        else:
+            return None
+
+    if len(stack) != 1:
+        return None
+    return (lines, stack[0]) if cse else stack[0]
+
+
+def _codegen(program):
+    """Compile a program's expression source; eval() then runs CPython
+    bytecode instead of our token walk."""
+    src = _codegen_source(program)
+    if src is None:
+        return None
+    try:
+        return compile(src, '<rpn>', 'eval')
+    except (SyntaxError, RecursionError, MemoryError):
+        # Fully parenthesized output overflows CPython's nesting limit
+        # around 200 chained ops; such programs run on the interpreter
+        return None
+
+
+def _compile_vm(program):
+    """
+    Lower a program to flat opcode arrays for the numba VM, or None.
+
+    Only programs where every literal is a float and every operator has
+    a VM opcode qualify -- the VM computes in float64, and restricting
+    to float literals keeps its results identical to the generic
+    interpreter (no silent int -> float coercion). Fused super-
+    instructions re-expand to push+op here, so the VM tracks its own
+    stack depth rather than reusing the fused program's.
+    """
+    import numpy as np
+
+    if not program:
+        # Empty expressions evaluate to True; the VM has nothing to run
+        # and would return whatever np.empty() handed it
+        return None
+
+    code: List[int] = []
+    args: List[int] = []
+    consts: List[float] = []
+    const_idx: Dict[str, int] = {}
+    slots: Dict[str, int] = {}
+    depth = max_depth = 0
+
+    def _push_const(value):
+        if type(value) is not float:
+            return False
+        # Dedupe the pool; keyed by repr so 0.0 and -0.0 stay distinct
+        idx = const_idx.setdefault(repr(value), len(consts))
+        if idx == len(consts):
+            consts.append(value)
+        code.append(_numba_vm.OP_CONST)
+        args.append(idx)
+        return True
+
+    for kind, payload, token in program:
+        if kind == _OP_PUSH:
+            if not _push_const(payload):
+                return None
+            depth += 1
+        elif kind == _OP_BINARY:
+            op = _numba_vm.BINARY_OPS.get(token)
+            if op is None:
+                return None
+            code.append(op)
+            args.append(0)
+            depth -= 1
+        elif kind == _OP_UNARY:
+            op = _numba_vm.UNARY_OPS.get(token)
+            if op is None:
+                return None
+            code.append(op)
+            args.append(0)
+        elif kind == _OP_NAME:
+            code.append(_numba_vm.OP_VAR)
+            args.append(slots.setdefault(token, len(slots)))
+            depth += 1
+        elif kind == _OP_BINARY_CONST:
+            op = _numba_vm.BINARY_OPS.get(token)
+            if op is None or not _push_const(payload[1]):
+                return None
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+            code.append(op)
+            args.append(0)
+            depth -= 1
+        else:
+            return None
+        if depth > max_depth:
+            max_depth = depth
+
+    names = list(slots)
+    return (np.asarray(code, dtype=np.int32),
+            np.asarray(args, dtype=np.int32),
+            np.asarray(consts, dtype=np.float64),
+            names,
+            max(max_depth, 1))
+
+
+# Compiled bundles hold code objects, so this cache runs at an eighth
+# of the normal budget
+@lru_cache(maxsize=max(_CACHE_SIZE // 8, 1))
+def _compile_tokens(tokens: Tuple[Union[str, int, float], ...]) -> tuple:
+    """
+    Compile a token tuple once; instances with equal tokens share the result.
+
+    Resolves each token into a (kind, payload, token) step so eval()
+    dispatches on a small integer instead of hashing token strings per
+    call, then runs the peephole and constant-folding passes and lowers
+    the result for the VM/codegen back ends. Names (variables and
+    constants) stay symbolic: they must be resolved against the eval-time
+    context to keep constant shadowing working.
+
+    Returns (program, max_depth, vm, code, names, const_result);
+    everything in the bundle is immutable or treated as read-only by the
+    interpreters.
+    """
+    program = []
+    for token in tokens:
+        if isinstance(token, str):
+            if token in _STACK_OPS:
+                program.append((_OP_STACK, _STACK_OPS_INPLACE[token], token))
+            elif token in _OPERATORS:
+                kind = _OP_UNARY if token in _UNARY_OPS else _OP_BINARY
+                program.append((kind, _OPERATORS[token], token))
+            else:
+                program.append((_OP_NAME, token, token))
+        else:
+            program.append((_OP_PUSH, token, token))
+    folded = _fuse_binary_const(_fold_program(_peephole(program)))
+
+    # Assign each distinct name a slot index. The fast interpreter binds
+    # every name once per call into a positional list and then indexes it,
+    # so a name used N times costs one hash, not N. The generic and
+    # batch interpreters keep resolving by token for exact errors.
+    slots: Dict[str, int] = {}
+    for i, (kind, _payload, token) in enumerate(folded):
+        if kind == _OP_NAME:
+            folded[i] = (_OP_NAME, slots.setdefault(token, len(slots)), token)
+    names = tuple(slots)
+    folded = tuple(folded)
+    if len(folded) == 1 and folded[0][0] == _OP_PUSH:
+        # Fully folded: eval() returns this without touching the stack.
+        # Folding never executes an op that raises, so no error case
+        # can hide behind the stored value.
+        const_result = folded[0][1]
+    else:
+        const_result = _UNKNOWN
+    max_depth = _static_stack_depth(folded)
+    vm = None
+    if _numba_vm.HAS_NUMBA and max_depth is not None:
+        vm = _compile_vm(folded)
+    return folded, max_depth, vm, _codegen(folded), names, const_result
+
+
+def _normalize_token(token: Union[str, int, float]) -> Union[str, int, float]:
+    """Convert a numeric-looking string token to int/float, else pass through."""
+    if isinstance(token, str):
+        # Try to parse as number, but don't force it
+        try:
+            if '.' in token:
+                return float(token)
+            stripped = token.lstrip('-')
+            if stripped.isdigit():  # Handle negative integers
+                return int(token)
+            # Scientific notation ('1e3', '-2E5') -- but not names like
+            # 'exp', or the 'inf'/'nan' specials, which stay symbolic
+            if ('e' in token or 'E' in token) and stripped[:1].isdigit():
+                return float(token)
+        except ValueError:
+            pass  # Keep as string if parsing fails
+        # Intern operator/name tokens: equal tokens share one string object,
+        # so the dict lookups at compile time hit the pointer-equality fast
+        # path and token storage is deduplicated across instances
+        return sys.intern(token)
+    return token
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_source(source: str) -> Tuple[Union[str, int, float], ...]:
+    """
+    Tokenize an expression string into normalized tokens.
+
+    Cached so repeated construction from the same source string skips both
+    the split and the per-token numeric conversion. Returns an immutable
+    tuple so cached results can be shared safely between RPN instances.
+    """
+    return tuple(_normalize_token(token) for token in source.split())
+
+
+def _is_number_str(token_str: str) -> bool:
+    """Check if a string can be parsed as a number."""
+    try:
+        # Try to parse as int first, then float
+        if '.' in token_str or 'e' in token_str.lower():
+            float(token_str)
+        else:
+            int(token_str)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _validate_tokens(tokens: Tuple[Union[str, int, float], ...]) -> Tuple[str, ...]:
+    """
+    Stack-effect validation walk over a token tuple, cached.
+
+    Repeated constructions of the same expression (strict mode validates on
+    every __init__) skip the O(n) walk. Returns error messages in discovery
+    order; strict callers raise the first one.
+    """
+    errors = []
+    stack_size = 0
+
+    for i, token in enumerate(tokens):
+        token_str = str(token)
+        if token_str in _STACK_OPS:
+            # Handle stack operations specially
+            if token_str in ('dup', 'over') and stack_size < 1:
+                errors.append(f"Token {i}: '{token}' requires at least 1 item on stack, but stack has {stack_size}")
+            elif token_str in ('swap', 'rot') and stack_size < 2:
+                errors.append(f"Token {i}: '{token}' requires at least 2 items on stack, but stack has {stack_size}")
+            elif token_str == 'drop' and stack_size < 1:
+                errors.append(f"Token {i}: '{token}' requires at least 1 item on stack, but stack has {stack_size}")
+
+            # Update stack size based on stack operation
+            if token_str == 'dup':
+                stack_size += 1  # Duplicates top item
+            elif token_str == 'drop':
+                stack_size -= 1  # Removes top item
+            elif token_str == 'over':
+                stack_size += 1  # Copies second item to top
+            # swap and rot don't change stack size
+
+        elif token_str in _OPERATORS:
+            # Handle regular operators
+            required_operands = 1 if token_str in _UNARY_OPS else 2
+            if stack_size < required_operands:
+                errors.append(f"Token {i}: '{token}' requires {required_operands} operands, but stack only has {stack_size}")
+            stack_size -= required_operands - 1  # Pop operands, push result
+        else:
+            # It's a number, variable, or constant - add to stack
+            stack_size += 1
+
+    # Only validate stack size if we're certain it's not due to unknown operators
+    # Unknown operators will be caught during evaluation
+    if stack_size != 1 and stack_size > 0:
+        # Only enforce single result if all tokens are known
+        if all(str(token) in _OPERATORS or str(token) in _STACK_OPS
+               or str(token) in _CONSTANTS or _is_number_str(str(token))
+               for token in tokens):
+            errors.append(f"Expression leaves {stack_size} items on stack, expected 1")
+
+    return tuple(errors)
+
+
 class RPN(BaseModel):
     """
     A delightful RPN (Reverse Polish Notation) expression with Pydantic integration.
@@ -41,60 +763,6 @@ class RPN(BaseModel):
     strict: bool = Field(default=False, description="Whether to validate expression on creation")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Optional metadata")
     
-    # Built-in operators
-    _operators = {
-        '+': operator.add,
-        '-': operator.sub,
-        '*': operator.mul,
-        '/': operator.truediv,
-        '//': operator.floordiv,
-        '%': operator.mod,
-        '**': operator.pow,
-        'pow': operator.pow,
-        '==': operator.eq,
-        '!=': operator.ne,
-        '<': operator.lt,
-        '>': operator.gt,
-        '<=': operator.le,
-        '>=': operator.ge,
-        'and': operator.and_,
-        'or': operator.or_,
-        'not': operator.not_,
-        'abs': abs,
-        'neg': operator.neg,
-        'sqrt': math.sqrt,
-        'sin': math.sin,
-        'cos': math.cos,
-        'tan': math.tan,
-        'log': math.log10,
-        'ln': math.log,
-        'exp': math.exp,
-        'ceil': math.ceil,
-        'floor': math.floor,
-        'round': round,
-        'max': max,
-        'min': min,
-    }
-    
-    # Stack operations - these should fail if insufficient items
-    _stack_ops = {
-        'dup': lambda stack: stack + [stack[-1]] if len(stack) >= 1 else (_ for _ in ()).throw(EvaluationError("dup requires at least 1 item on stack")),
-        'drop': lambda stack: stack[:-1] if len(stack) >= 1 else (_ for _ in ()).throw(EvaluationError("drop requires at least 1 item on stack")),
-        'swap': lambda stack: stack[:-2] + [stack[-1], stack[-2]] if len(stack) >= 2 else (_ for _ in ()).throw(EvaluationError("swap requires at least 2 items on stack")),
-        'rot': lambda stack: stack[:-3] + [stack[-2], stack[-1], stack[-3]] if len(stack) >= 3 else (_ for _ in ()).throw(EvaluationError("rot requires at least 3 items on stack")),
-        'over': lambda stack: stack + [stack[-2]] if len(stack) >= 2 else (_ for _ in ()).throw(EvaluationError("over requires at least 2 items on stack")),
-    }
-    
-    # Constants
-    _constants = {
-        'pi': math.pi,
-        'e': math.e,
-        'tau': math.tau,
-        'inf': math.inf,
-        'true': True,
-        'false': False,
-    }
-    
     def __init__(self, expression=None, **kwargs):
         """
         Create an RPN expression.
@@ -104,37 +772,96 @@ class RPN(BaseModel):
             **kwargs: Additional parameters (defaults, strict, metadata)
         """
         if isinstance(expression, str):
-            tokens = expression.split()
-        elif isinstance(expression, list):
-            tokens = expression
-        elif expression is None:
-            tokens = []
+            processed_tokens = list(_parse_source(expression))
         else:
-            # Handle variadic args: RPN(3, 4, "+")
-            tokens = [expression] + list(kwargs.pop('_args', []))
-            
-        # Convert numeric strings to numbers
-        processed_tokens = []
-        for token in tokens:
-            if isinstance(token, str):
-                # Try to parse as number, but don't force it
-                try:
-                    if '.' in token:
-                        processed_tokens.append(float(token))
-                    elif token.lstrip('-').isdigit():  # Handle negative integers
-                        processed_tokens.append(int(token))
-                    else:
-                        processed_tokens.append(token)  # Keep as string
-                except ValueError:
-                    processed_tokens.append(token)  # Keep as string if parsing fails
+            if isinstance(expression, list):
+                tokens = expression
+            elif expression is None:
+                tokens = []
             else:
-                processed_tokens.append(token)
-        
+                # Handle variadic args: RPN(3, 4, "+")
+                tokens = [expression] + list(kwargs.pop('_args', []))
+
+            # Convert numeric strings to numbers
+            processed_tokens = [_normalize_token(token) for token in tokens]
+
         super().__init__(tokens=processed_tokens, **kwargs)
-        
+
         if self.strict:
             self.validate_expression()
-    
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache derived state used on the eval() hot path."""
+        # Variable-free expressions can have their eval() result memoized
+        # by token tuple (eval() also checks that no defaults are in
+        # play, which can change after construction)
+        self._is_const = all(
+            not isinstance(token, str)
+            or token in _OPERATORS
+            or token in _STACK_OPS
+            or token in _CONSTANTS
+            for token in self.tokens
+        )
+        # Compiled program and its static stack depth, built lazily on
+        # first eval()
+        self._program = None
+        self._max_depth = None
+        # Flat-array form for the optional numba VM (float-only programs)
+        self._vm = None
+        # Python code object for straight-line programs (see _codegen)
+        self._code = None
+        # Distinct names in slot order; NAME payloads index into these
+        self._names = None
+        # Result of a program that folds to a single literal (see _compile)
+        self._const_result = _UNKNOWN
+        # Per-variable-binding result memo, built lazily by eval()
+        self._eval_cache = None
+        # Token tuple and hash, computed on first use (cache keys)
+        self._tokens_t = None
+        self._hash = None
+
+    @classmethod
+    def _fast(cls, tokens: List[Union[str, int, float]], **kwargs) -> 'RPN':
+        """
+        Create an RPN from already-normalized tokens, skipping validation.
+
+        Uses model_construct, so neither pydantic field coercion nor token
+        normalization runs. For internal callers only (composition, method
+        chaining, partial evaluation, the builder): the caller must own the
+        token list and any defaults/metadata dicts it passes, as they are
+        stored without copying.
+        """
+        return cls.model_construct(tokens=tokens, **kwargs)
+
+    def _token_tuple(self) -> Tuple[Union[str, int, float], ...]:
+        """
+        The tokens as an immutable tuple, computed once per instance.
+
+        Used as the key for the shared caches; assumes the token list is
+        not mutated after construction (the library itself never does).
+        """
+        tokens_t = self._tokens_t
+        if tokens_t is None:
+            tokens_t = self._tokens_t = tuple(self.tokens)
+        return tokens_t
+
+    def __hash__(self) -> int:
+        """Hash by token tuple so expressions can key sets, dicts, and
+        lru_caches; equal models always have equal tokens, keeping this
+        consistent with pydantic's field-wise __eq__."""
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self._token_tuple())
+        return h
+
+    def _extend(self, token: Union[str, int, float]) -> 'RPN':
+        """Return a copy with one more (already normalized) token appended."""
+        extended = RPN._fast(self.tokens + [token],
+                             defaults=dict(self.defaults), strict=self.strict)
+        if self.strict:
+            extended.validate_expression()
+        return extended
+
     @classmethod
     def __get_validators__(cls):
         yield cls.validate
@@ -149,78 +876,26 @@ class RPN(BaseModel):
     def validate_expression(self) -> List[str]:
         """
         Validate the RPN expression syntax.
-        
+
         Returns:
             List of error messages (empty if valid)
-            
+
         Raises:
             ValidationError: If expression is invalid and strict=True
         """
-        errors = []
-        stack_size = 0
-        
-        for i, token in enumerate(self.tokens):
-            if self._is_operator(token):
-                if str(token) in self._stack_ops:
-                    # Handle stack operations specially
-                    if str(token) in ['dup', 'over'] and stack_size < 1:
-                        error = f"Token {i}: '{token}' requires at least 1 item on stack, but stack has {stack_size}"
-                        errors.append(error)
-                        if self.strict:
-                            raise ValidationError(error)
-                    elif str(token) in ['swap', 'rot'] and stack_size < 2:
-                        error = f"Token {i}: '{token}' requires at least 2 items on stack, but stack has {stack_size}"
-                        errors.append(error)
-                        if self.strict:
-                            raise ValidationError(error)
-                    elif str(token) == 'drop' and stack_size < 1:
-                        error = f"Token {i}: '{token}' requires at least 1 item on stack, but stack has {stack_size}"
-                        errors.append(error)
-                        if self.strict:
-                            raise ValidationError(error)
-                    
-                    # Update stack size based on stack operation
-                    if str(token) == 'dup':
-                        stack_size += 1  # Duplicates top item
-                    elif str(token) == 'drop':
-                        stack_size -= 1  # Removes top item
-                    elif str(token) == 'over':
-                        stack_size += 1  # Copies second item to top
-                    # swap and rot don't change stack size
-                        
-                else:
-                    # Handle regular operators
-                    required_operands = self._get_operator_arity(token)
-                    if stack_size < required_operands:
-                        error = f"Token {i}: '{token}' requires {required_operands} operands, but stack only has {stack_size}"
-                        errors.append(error)
-                        if self.strict:
-                            raise ValidationError(error)
-                    stack_size -= required_operands - 1  # Pop operands, push result
-            else:
-                # It's a number, variable, or constant - add to stack
-                stack_size += 1
-        
-        # Only validate stack size if we're certain it's not due to unknown operators
-        # Unknown operators will be caught during evaluation
-        if stack_size != 1 and stack_size > 0:
-            # Only enforce single result if all tokens are known
-            if all(self._is_operator(token) or self._is_known_token(token) for token in self.tokens):
-                error = f"Expression leaves {stack_size} items on stack, expected 1"
-                errors.append(error)
-                if self.strict:
-                    raise ValidationError(error)
-                
-        return errors
+        errors = _validate_tokens(self._token_tuple())
+        if errors and self.strict:
+            raise ValidationError(errors[0])
+        return list(errors)
     
     def _is_operator(self, token: Any) -> bool:
         """Check if token is an operator."""
-        return str(token) in self._operators or str(token) in self._stack_ops
+        return str(token) in _OPERATORS or str(token) in _STACK_OPS
     
     def _is_known_token(self, token: Any) -> bool:
         """Check if token is a known constant or can be parsed as number."""
         token_str = str(token)
-        return (token_str in self._constants or 
+        return (token_str in _CONSTANTS or 
                 self._is_number(token_str))
     
     def _is_number(self, token_str: str) -> bool:
@@ -237,10 +912,7 @@ class RPN(BaseModel):
     
     def _get_operator_arity(self, token: str) -> int:
         """Get the number of operands an operator requires (excludes stack operations)."""
-        unary_ops = {'not', 'abs', 'neg', 'sqrt', 'sin', 'cos', 'tan', 'log', 'ln', 'exp', 'ceil', 'floor', 'round'}
-        if token in unary_ops:
-            return 1
-        return 2
+        return 1 if token in _UNARY_OPS else 2
     
     def eval(self, **variables) -> Union[int, float, bool]:
         """
@@ -255,40 +927,203 @@ class RPN(BaseModel):
         Raises:
             EvaluationError: If evaluation fails
         """
-        # Merge defaults with provided variables
-        context = {**self.defaults, **variables}
-        
+        # Merge defaults with provided variables (skip the merge entirely
+        # when there are no defaults -- the common case). Checked live
+        # rather than via a flag cached at construction, so defaults
+        # added to the instance afterwards are honored.
+        defaults = self.defaults
+        if defaults:
+            context = {**defaults, **variables}
+        else:
+            # Constant expressions always produce the same result, so
+            # repeated eval() calls can be served from a shared cache
+            # (defaults can shadow constants, hence the gate above)
+            if not variables and self._is_const:
+                return _eval_const_result(self._token_tuple())
+            context = variables if variables else _EMPTY_DICT
+
+        # Every operator is a pure function, so a repeated call with the
+        # same bindings returns the memoized result. The key is built
+        # from the resolved context (so mutating defaults is seen) and is
+        # typed (so x=1 and x=1.0 cache separately, like
+        # lru_cache(typed=True)). Only successes are cached; errors
+        # re-raise on every call. Unhashable values (TypeError on the
+        # key) just evaluate directly.
+        cache = self._eval_cache
+        if cache is None:
+            cache = self._eval_cache = {}
+        try:
+            key = tuple(sorted(
+                (name, value, value.__class__)
+                for name, value in context.items()
+            )) if context else ()
+            result = cache.get(key, _UNKNOWN)
+            if result is not _UNKNOWN:
+                return result
+        except TypeError:
+            key = None
+
+        result = self._eval_tokens(context)
+        if key is not None:
+            if len(cache) >= _CACHE_SIZE:  # Bounded like the module-level caches
+                cache.pop(next(iter(cache)))
+            cache[key] = result
+        return result
+
+    def _compile(self) -> Tuple[Tuple[int, Any, Any], ...]:
+        """Fetch the shared compiled form of this expression's tokens."""
+        (folded, self._max_depth, self._vm, self._code, self._names,
+         self._const_result) = _compile_tokens(self._token_tuple())
+        return folded
+
+    def _run_vm(self, context: Dict[str, Any]) -> float:
+        """Bind variables into a float64 array and run the numba VM.
+
+        The VM computes in float64, so it only matches the generic
+        interpreter when every input is already a float. Literals were
+        checked at compile time; bindings can only be checked here --
+        anything else (ints would change result types, and large ints
+        would silently lose precision) raises into the caller's fallback.
+        """
+        import numpy as np
+
+        code, args, consts, names, depth = self._vm
+        variables = np.empty(len(names))
+        for i, name in enumerate(names):
+            value = (context[name] if name in context
+                     else self._resolve_token(name, context))
+            if type(value) is not float:
+                raise TypeError(f"non-float binding for '{name}'")
+            variables[i] = value
+        result = _numba_vm.run(code, args, consts, variables,
+                               np.empty(depth))
+        if not math.isfinite(result):
+            # Under njit, sqrt/log/log10 signal domain errors with nan or
+            # -inf (and exp overflows to inf) instead of raising like
+            # CPython's math module. Re-run on the interpreter, which
+            # raises -- or legitimately returns non-finite -- exactly as
+            # the generic path would.
+            raise ValueError('non-finite VM result')
+        # Plain Python float: never leak a NumPy scalar to callers
+        return float(result)
+
+    def _eval_tokens(self, context: Dict[str, Any]) -> Union[int, float, bool]:
+        """Interpret the compiled program with a resolved context."""
+        program = self._program
+        if program is None:
+            program = self._program = self._compile()
+
+        if self._const_result is not _UNKNOWN:
+            return self._const_result
+
+        if self._vm is not None:
+            try:
+                return self._run_vm(context)
+            except Exception:
+                pass  # Fall through; slower paths report errors properly
+
+        if self._code is not None:
+            try:
+                # Locals fall back to constants so variables still shadow them
+                return eval(self._code, _CODEGEN_GLOBALS, ChainMap(context, _CONSTANTS))
+            except Exception:
+                pass  # Re-run on the generic path for exact error wrapping
+
+        if self._max_depth is not None:
+            try:
+                return self._eval_fast(program, context)
+            except Exception:
+                pass  # Re-run on the generic path for exact error wrapping
+
+        return self._eval_generic(program, context)
+
+    def _eval_fast(self, program, context: Dict[str, Any]) -> Union[int, float, bool]:
+        """
+        Fixed-size-stack interpreter for statically analyzed programs.
+
+        The stack is preallocated to the program's known maximum depth and
+        indexed through a stack pointer, avoiding append/pop calls. (An
+        array('d') stack was benchmarked for this but lost to a plain list:
+        it re-boxes a float object on every read.) Has no error handling of
+        its own -- any exception makes the caller re-run _eval_generic,
+        which raises with the usual per-token wrapping.
+        """
+        # Bind each distinct name once: one hash per name per call, then
+        # NAME steps index vals by their compile-time slot
+        vals = None
+        if self._names:
+            ctx_get = context.get
+            vals = [None] * len(self._names)
+            for i, name in enumerate(self._names):
+                value = ctx_get(name, _UNKNOWN)
+                if value is _UNKNOWN:
+                    value = self._resolve_token(name, context)
+                vals[i] = value
+
+        pool = _STACK_POOL
+        if pool:
+            stack = pool.pop()
+            if len(stack) < self._max_depth:
+                stack.extend([None] * (self._max_depth - len(stack)))
+        else:
+            stack = [None] * self._max_depth
+        sp = 0
+        try:
+            for kind, payload, token in program:
+                if kind == _OP_PUSH:
+                    stack[sp] = payload
+                    sp += 1
+                elif kind == _OP_BINARY:
+                    sp -= 1
+                    stack[sp - 1] = payload(stack[sp - 1], stack[sp])
+                elif kind == _OP_UNARY:
+                    stack[sp - 1] = payload(stack[sp - 1])
+                elif kind == _OP_NAME:
+                    stack[sp] = vals[payload]
+                    sp += 1
+                else:  # _OP_BINARY_CONST
+                    stack[sp - 1] = payload[0](stack[sp - 1], payload[1])
+
+            # Same result convention as the generic path
+            return stack[sp - 1] if sp else True
+        finally:
+            if len(pool) < _STACK_POOL_MAX:
+                pool.append(stack)
+
+    def _eval_generic(self, program, context: Dict[str, Any]) -> Union[int, float, bool]:
+        """List-stack interpreter handling stack ops and error reporting."""
         stack = []
-        
-        for token in self.tokens:
+        ctx_get = context.get
+
+        for kind, payload, token in program:
             try:
-                if self._is_operator(token):
-                    if str(token) in self._stack_ops:
-                        stack = self._stack_ops[str(token)](stack)
-                    else:
-                        func = self._operators[str(token)]
-                        arity = self._get_operator_arity(str(token))
-                        
-                        if len(stack) < arity:
-                            raise EvaluationError(f"Insufficient operands for '{token}'")
-                        
-                        if arity == 1:
-                            operand = stack.pop()
-                            result = func(operand)
-                        else:
-                            right = stack.pop()
-                            left = stack.pop()
-                            result = func(left, right)
-                        
-                        stack.append(result)
-                else:
-                    # Handle variables, constants, and literals
-                    value = self._resolve_token(token, context)
+                if kind == _OP_PUSH:
+                    stack.append(payload)
+                elif kind == _OP_BINARY:
+                    if len(stack) < 2:
+                        raise EvaluationError(f"Insufficient operands for '{token}'")
+                    right = stack.pop()
+                    left = stack.pop()
+                    stack.append(payload(left, right))
+                elif kind == _OP_UNARY:
+                    if not stack:
+                        raise EvaluationError(f"Insufficient operands for '{token}'")
+                    stack.append(payload(stack.pop()))
+                elif kind == _OP_STACK:
+                    payload(stack)
+                elif kind == _OP_BINARY_CONST:
+                    if not stack:
+                        raise EvaluationError(f"Insufficient operands for '{token}'")
+                    stack.append(payload[0](stack.pop(), payload[1]))
+                else:  # _OP_NAME: variable, constant, or numeric string
+                    value = ctx_get(token, _UNKNOWN)
+                    if value is _UNKNOWN:
+                        value = self._resolve_token(token, context)
                     stack.append(value)
-                    
+
             except Exception as e:
                 raise EvaluationError(f"Error evaluating token '{token}': {str(e)}") from e
-        
+
         if len(stack) == 0:
             # Empty expression returns True (or could return 0)
             return True
@@ -302,22 +1137,159 @@ class RPN(BaseModel):
     def __call__(self, **variables) -> Union[int, float, bool]:
         """Make RPN objects directly callable - cleaner than .eval()"""
         return self.eval(**variables)
+
+    def eval_batch(self, **variables) -> Any:
+        """
+        Evaluate the expression elementwise over arrays of variable values.
+
+        Each keyword argument is an array-like of values for one variable;
+        all arrays must broadcast to a common shape. The interpreter runs
+        once per operator instead of once per element, with NumPy ufuncs
+        doing the elementwise work.
+
+        Requires numpy (an optional dependency). Returns an ndarray shaped
+        like the broadcast inputs.
+
+            >>> RPN("x 2 * y +").eval_batch(x=[1, 2], y=[10, 20])
+            array([12, 24])
+        """
+        import numpy as np  # Deferred import: numpy is optional
+
+        program = self._program
+        if program is None:
+            program = self._program = self._compile()
+
+        arrays = {name: np.asarray(value) for name, value in variables.items()}
+        context = {**self.defaults, **arrays} if self.defaults else arrays
+
+        ops = _numpy_operators(np)
+        stack = []
+        for kind, payload, token in program:
+            try:
+                if kind == _OP_PUSH:
+                    stack.append(payload)
+                elif kind == _OP_BINARY:
+                    if len(stack) < 2:
+                        raise EvaluationError(f"Insufficient operands for '{token}'")
+                    right = stack.pop()
+                    left = stack.pop()
+                    func = np.hypot if payload is math.hypot else ops.get(token, payload)
+                    stack.append(func(left, right))
+                elif kind == _OP_UNARY:
+                    if not stack:
+                        raise EvaluationError(f"Insufficient operands for '{token}'")
+                    stack.append(ops.get(token, payload)(stack.pop()))
+                elif kind == _OP_STACK:
+                    payload(stack)
+                elif kind == _OP_BINARY_CONST:
+                    if not stack:
+                        raise EvaluationError(f"Insufficient operands for '{token}'")
+                    func = (np.hypot if payload[0] is math.hypot
+                            else ops.get(token, payload[0]))
+                    stack.append(func(stack.pop(), payload[1]))
+                elif token in context:
+                    stack.append(context[token])
+                else:
+                    stack.append(self._resolve_token(token, context))
+
+            except Exception as e:
+                raise EvaluationError(f"Error evaluating token '{token}': {str(e)}") from e
+
+        result = np.asarray(stack[-1] if stack else True)
+        if arrays:
+            shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+            if result.shape != shape:
+                result = np.broadcast_to(result, shape)
+        return result
     
-    def _resolve_token(self, token: Any, context: Dict[str, Any]) -> Union[int, float, bool]:
-        """Resolve a token to its numeric value."""
-        if isinstance(token, (int, float, bool)):
-            return token
-        
-        token_str = str(token)
-        
-        # Check variables first (allows shadowing of constants)
-        if token_str in context:
-            return context[token_str]
-        
+    def precompile(self) -> 'RPN':
+        """
+        Compile the expression now instead of on first eval().
+
+        Useful before handing an instance to a hot loop or worker pool so
+        the first call doesn't pay the compile cost. Returns self for
+        chaining: RPN("price tax +").precompile().
+        """
+        if self._program is None:
+            self._program = self._compile()
+        return self
+
+    def jit(self) -> Callable[..., Union[int, float, bool]]:
+        """
+        Return a specialized function for this expression.
+
+        Lowers the compiled program to a straight-line Python function of
+        the expression's variables -- constants and stored defaults become
+        keyword defaults -- and compiles it with numba's njit when numba
+        is installed. The returned callable skips eval()'s context
+        handling and memoization entirely, which pays off when one
+        expression runs in a tight loop:
+
+            >>> f = RPN("x 2 * y +").jit()
+            >>> f(x=5, y=3)
+            13
+
+        Programs the codegen can't express (stack ops, non-identifier
+        variable names) fall back to the bound eval method.
+        """
+        program = self._program
+        if program is None:
+            program = self._program = self._compile()
+
+        lowered = _codegen_source(program, cse=True)
+        if lowered is None:
+            return self.eval
+        lines, result = lowered
+
+        # Names with a known value become keyword defaults (overridable,
+        # so variables still shadow constants); the rest are required.
+        bound = {name: _CONSTANTS[name] for name in self._names
+                 if name in _CONSTANTS}
+        for name, value in self.defaults.items():
+            if name in self._names:
+                bound[name] = value
+        params = [name for name in self._names if name not in bound]
+        # Bound values go into the exec namespace as objects and are
+        # referenced by synthetic names -- repr round-tripping breaks on
+        # values like math.inf, whose repr isn't defined under our
+        # stripped-down globals
+        env = dict(_CODEGEN_GLOBALS)
+        for i, name in enumerate(n for n in self._names if n in bound):
+            env[f'_default_{i}'] = bound[name]
+            params.append(f'{name}=_default_{i}')
+        body = '\n    '.join(lines + [f'return {result}'])
+        ns: Dict[str, Any] = {}
+        try:
+            exec(compile(f'def _rpn_jit({", ".join(params)}):\n    {body}',
+                         '<rpn-jit>', 'exec'), env, ns)
+        except Exception:
+            return self.eval
+        fn = ns['_rpn_jit']
+        if _numba_vm.HAS_NUMBA:
+            fn = _numba_vm.numba.njit(fn)
+        return fn
+
+    def _resolve_token(self, token: str, context: Dict[str, Any]) -> Union[int, float, bool]:
+        """Resolve a name token to its numeric value.
+
+        Only called for _OP_NAME steps, so the token is always a string --
+        numeric literals were tagged _OP_PUSH at compile time and never
+        reach this (no per-token type check at eval time).
+        """
+        token_str = token
+
+        # Check variables first (allows shadowing of constants); sentinel
+        # .get() resolves each name with one hash instead of two
+        value = context.get(token_str, _UNKNOWN)
+        if value is not _UNKNOWN:
+            return value
+
         # Then check constants
-        if token_str in self._constants:
-            return self._constants[token_str]
-        
+        value = _CONSTANTS.get(token_str, _UNKNOWN)
+        if value is not _UNKNOWN:
+            return value
+
+
         # Try to parse as number
         try:
             # Check if it looks like a float (contains ., e, or E for scientific notation)
@@ -345,10 +1317,13 @@ class RPN(BaseModel):
         if isinstance(other, RPN):
             # Preserve non-strict mode if either expression is non-strict
             strict = self.strict and other.strict
-            return RPN(self.tokens + other.tokens, 
-                      defaults={**self.defaults, **other.defaults},
-                      strict=strict,
-                      metadata={**self.metadata, **other.metadata})
+            combined = RPN._fast(self.tokens + other.tokens,
+                                 defaults={**self.defaults, **other.defaults},
+                                 strict=strict,
+                                 metadata={**self.metadata, **other.metadata})
+            if strict:
+                combined.validate_expression()
+            return combined
         return NotImplemented
     
     def __or__(self, other: 'RPN') -> Union[int, float, bool]:
@@ -359,89 +1334,91 @@ class RPN(BaseModel):
     # Method chaining operations
     def push(self, value: Union[int, float, str]) -> 'RPN':
         """Push a value onto the expression stack."""
-        return RPN(self.tokens + [value], defaults=self.defaults, strict=self.strict)
+        return self._extend(_normalize_token(value))
     
     def add(self) -> 'RPN':
         """Add the + operator."""
-        return RPN(self.tokens + ['+'], defaults=self.defaults, strict=self.strict)
+        return self._extend('+')
     
     def sub(self) -> 'RPN':
         """Add the - operator."""
-        return RPN(self.tokens + ['-'], defaults=self.defaults, strict=self.strict)
+        return self._extend('-')
     
     def mul(self) -> 'RPN':
         """Add the * operator."""
-        return RPN(self.tokens + ['*'], defaults=self.defaults, strict=self.strict)
+        return self._extend('*')
     
     def div(self) -> 'RPN':
         """Add the / operator."""
-        return RPN(self.tokens + ['/'], defaults=self.defaults, strict=self.strict)
+        return self._extend('/')
     
     def pow(self) -> 'RPN':
         """Add the ** operator."""
-        return RPN(self.tokens + ['**'], defaults=self.defaults, strict=self.strict)
+        return self._extend('**')
     
     # Stack operations
     def dup(self) -> 'RPN':
         """Duplicate top stack item."""
-        return RPN(self.tokens + ['dup'], defaults=self.defaults, strict=self.strict)
+        return self._extend('dup')
     
     def swap(self) -> 'RPN':
         """Swap top two stack items."""
-        return RPN(self.tokens + ['swap'], defaults=self.defaults, strict=self.strict)
+        return self._extend('swap')
     
     def drop(self) -> 'RPN':
         """Drop top stack item."""
-        return RPN(self.tokens + ['drop'], defaults=self.defaults, strict=self.strict)
+        return self._extend('drop')
     
     def rot(self) -> 'RPN':
         """Rotate top three stack items."""
-        return RPN(self.tokens + ['rot'], defaults=self.defaults, strict=self.strict)
+        return self._extend('rot')
     
     def over(self) -> 'RPN':
         """Copy second item to top."""
-        return RPN(self.tokens + ['over'], defaults=self.defaults, strict=self.strict)
+        return self._extend('over')
     
     # Math functions
     def sqrt(self) -> 'RPN':
         """Add sqrt function."""
-        return RPN(self.tokens + ['sqrt'], defaults=self.defaults, strict=self.strict)
+        return self._extend('sqrt')
     
     def sin(self) -> 'RPN':
         """Add sin function."""
-        return RPN(self.tokens + ['sin'], defaults=self.defaults, strict=self.strict)
+        return self._extend('sin')
     
     def cos(self) -> 'RPN':
         """Add cos function."""
-        return RPN(self.tokens + ['cos'], defaults=self.defaults, strict=self.strict)
+        return self._extend('cos')
     
     # Conversion methods
     def to_infix(self) -> str:
         """Convert RPN to infix notation (basic implementation)."""
+        # The stack holds lists of string segments rather than joined strings,
+        # so deeply nested expressions cost O(n) string work instead of O(n^2)
         stack = []
-        
+
         for token in self.tokens:
-            if self._is_operator(token) and str(token) not in self._stack_ops:
-                if str(token) in {'abs', 'sqrt', 'sin', 'cos', 'tan', 'log', 'ln', 'exp', 'ceil', 'floor', 'round', 'not', 'neg'}:
+            if self._is_operator(token) and str(token) not in _STACK_OPS:
+                if str(token) in _UNARY_OPS:
                     # Unary operator
                     if stack:
                         operand = stack.pop()
                         if token == 'neg':
-                            result = f"(-{operand})"
+                            result = ['(-', *operand, ')']
                         else:
-                            result = f"{token}({operand})"
+                            result = [str(token), '(', *operand, ')']
                         stack.append(result)
                 else:
                     # Binary operator
                     if len(stack) >= 2:
                         right = stack.pop()
                         left = stack.pop()
-                        result = f"({left} {token} {right})"
+                        result = ['(', *left, ' ', str(token), ' ', *right, ')']
                         stack.append(result)
             else:
-                stack.append(str(token))
-        
-        return stack[0] if stack else ""
+                stack.append([str(token)])
+
+        return ''.join(stack[0]) if stack else ""
     
     def to_prefix(self) -> str:
         """Convert RPN to prefix notation (basic implementation)."""
@@ -477,18 +1454,36 @@ class RPN(BaseModel):
     
     def partial(self, **values) -> 'RPN':
         """Create a new RPN with some variables pre-evaluated."""
-        new_defaults = {**self.defaults, **values}
-        return RPN(self.tokens, defaults=new_defaults, strict=self.strict, metadata=self.metadata)
+        new_defaults = {**self.defaults, **values} if self.defaults else dict(values)
+        return RPN._fast(list(self.tokens), defaults=new_defaults,
+                         strict=self.strict, metadata=dict(self.metadata))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _eval_const_result(tokens: Tuple[Union[str, int, float], ...]) -> Union[int, float, bool]:
+    """
+    Evaluate a constant (variable-free) token tuple, memoizing the result.
+
+    Only successful evaluations are cached: lru_cache does not store raised
+    exceptions, so expressions like "5 0 /" fail identically on every call.
+    """
+    return RPN._fast(list(tokens))._eval_tokens(_EMPTY_DICT)
 
 
 class RPNBuilder:
     """Fluent interface for building RPN expressions."""
-    
+
+    __slots__ = ('tokens',)
+
     def __init__(self):
         self.tokens = []
-    
+
     def push(self, value: Union[int, float, str]) -> 'RPNBuilder':
         """Push a value."""
+        # Normalize string values here ('3' -> 3) so build() never needs
+        # the full validating constructor
+        if isinstance(value, str):
+            value = _normalize_token(value)
         self.tokens.append(value)
         return self
     
@@ -596,7 +1591,7 @@ class RPNBuilder:
     
     def build(self) -> RPN:
         """Build the final RPN expression."""
-        return RPN(self.tokens)
+        return RPN._fast(list(self.tokens))
     
     def eval(self, **variables) -> Union[int, float, bool]:
         """Build and evaluate in one step."""
@@ -615,7 +1610,9 @@ class RPNExpr:
     Used internally by rpn() function. Supports auto-wrapping of numbers:
         rpn(3) + 4 * 2  # Only need rpn() once - numbers auto-wrap
     """
-    
+
+    __slots__ = ('_rpn',)
+
     def __init__(self, value: Union[str, List, int, float]):
         if isinstance(value, (int, float)):
             # Single number
@@ -0,0 +1,17 @@
+"""Shared fixtures for the test suite."""
+
+import functools
+
+import pytest
+
+from pydantic_rpn import RPN
+
+
+@pytest.fixture(scope="session")
+def rpn_cache():
+    """Memoizing RPN factory: one parse/compile per distinct source string.
+
+    Parametrized tests that build many structurally-identical expressions
+    share instances through this instead of re-parsing per case.
+    """
+    return functools.lru_cache(maxsize=None)(RPN)
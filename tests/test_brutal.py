@@ -2,92 +2,147 @@
 
 import pytest
 import math
-import json
+import random
+import re
+
+try:
+    # Use orjson's C-level parser for test-side JSON decoding when available
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 from pydantic_rpn import RPN, rpn, RPNError, ValidationError, EvaluationError, RPNBuilder
 
 
+# Memoized RPN constructor: parsing happens once per distinct source string,
+# so repeated assertions only pay for eval()
+_EXPR_CACHE = {}
+
+
+def R(source: str) -> RPN:
+    """Return a cached RPN for ``source``, parsing it at most once."""
+    expr = _EXPR_CACHE.get(source)
+    if expr is None:
+        expr = _EXPR_CACHE[source] = RPN(source)
+    return expr
+
+
+# Reference values computed once at module load
+SQRT2 = math.sqrt(2)
+EXPECTED_CI = 1000 * (1 + 0.05 / 12) ** (12 * 2)  # $1000 at 5%, monthly, 2 years
+
+
+def close(a, b, rel=1e-9):
+    """Cheap scalar float tolerance check -- avoids pytest.approx overhead."""
+    return abs(a - b) <= rel * max(1, abs(b))
+
+
+# Operator inventories as module-level tuples: allocated once, immutable
+BINARY_OPS = ('+', '-', '*', '/', '//', '%', '**', 'pow', 'max', 'min')
+UNARY_OPS = ('abs', 'neg', 'sqrt', 'sin', 'cos', 'tan', 'log', 'ln', 'exp', 'ceil', 'floor', 'round', 'not')
+STACK_OPS = ('dup', 'swap', 'drop', 'over', 'rot')
+
+# Every operator with too few operands, as one parametrized matrix
+INSUFFICIENT_OPERAND_CASES = (
+    [f"{op}" for op in BINARY_OPS]        # no operands
+    + [f"5 {op}" for op in BINARY_OPS]    # one operand
+    + [f"{op}" for op in UNARY_OPS]       # no operands
+)
+
+# Stack operations applied to stacks with too few items
+STACK_UNDERFLOW_CASES = (
+    list(STACK_OPS)                       # empty stack
+    + ["5 swap", "5 over"]                # need 2+ items
+    + ["5 rot", "5 6 rot"]                # need 3 items
+)
+
+
+# Expressions reused across several tests -- compiled once per session
+@pytest.fixture(scope="session")
+def xyz_expr():
+    return RPN("x y + z *")
+
+
+@pytest.fixture(scope="session")
+def template_xy():
+    return RPN.template("${x} ${y} +")
+
+
 class TestBasicOperationsBrutal:
     """Test every basic operation with edge cases."""
 
     def test_arithmetic_edge_cases(self):
         """Test arithmetic with edge cases."""
-        # Test with zero
-        assert RPN("0 5 +").eval() == 5
-        assert RPN("5 0 +").eval() == 5
-        assert RPN("5 0 *").eval() == 0
-        assert RPN("0 5 *").eval() == 0
-        
-        # Test with negative numbers
-        assert RPN("-5 3 +").eval() == -2
-        assert RPN("5 -3 +").eval() == 2
-        assert RPN("-5 -3 +").eval() == -8
-        assert RPN("-5 -3 *").eval() == 15
-        
-        # Test with floats
-        assert RPN("3.5 2.5 +").eval() == 6.0
-        assert RPN("7.5 2.5 /").eval() == 3.0
-        
-        # Test large numbers
-        assert RPN("1000000 1000000 +").eval() == 2000000
-        assert RPN("999 999 *").eval() == 998001
+        cases = [
+            # zero
+            ("0 5 +", 5), ("5 0 +", 5), ("5 0 *", 0), ("0 5 *", 0),
+            # negative numbers
+            ("-5 3 +", -2), ("5 -3 +", 2), ("-5 -3 +", -8), ("-5 -3 *", 15),
+            # floats
+            ("3.5 2.5 +", 6.0), ("7.5 2.5 /", 3.0),
+            # large numbers
+            ("1000000 1000000 +", 2000000), ("999 999 *", 998001),
+        ]
+        # One list comparison instead of a dozen separate assert frames
+        results = [R(expr).eval() for expr, _ in cases]
+        assert results == [value for _, value in cases]
 
     def test_division_edge_cases(self):
         """Test division with edge cases."""
         # Normal division
-        assert RPN("15 3 /").eval() == 5.0
-        assert RPN("7 2 /").eval() == 3.5
+        assert R("15 3 /").eval() == 5.0
+        assert R("7 2 /").eval() == 3.5
         
         # Floor division  
-        assert RPN("17 5 //").eval() == 3
-        assert RPN("17 -5 //").eval() == -4  # Python floor division behavior
+        assert R("17 5 //").eval() == 3
+        assert R("17 -5 //").eval() == -4  # Python floor division behavior
         
         # Modulo
-        assert RPN("17 5 %").eval() == 2
-        assert RPN("17 -5 %").eval() == -3  # Python modulo behavior
+        assert R("17 5 %").eval() == 2
+        assert R("17 -5 %").eval() == -3  # Python modulo behavior
         
         # Division by zero should fail
         with pytest.raises(EvaluationError):
-            RPN("5 0 /").eval()
+            R("5 0 /").eval()
         with pytest.raises(EvaluationError):
-            RPN("5 0 //").eval()
+            R("5 0 //").eval()
         with pytest.raises(EvaluationError):
-            RPN("5 0 %").eval()
+            R("5 0 %").eval()
 
     def test_power_operations(self):
         """Test power operations thoroughly."""
-        assert RPN("2 3 **").eval() == 8
-        assert RPN("2 3 pow").eval() == 8
-        assert RPN("5 0 **").eval() == 1
-        assert RPN("0 5 **").eval() == 0
-        assert RPN("2 -3 **").eval() == pytest.approx(0.125)
-        assert RPN("4 0.5 **").eval() == pytest.approx(2.0)  # √4
+        assert R("2 3 **").eval() == 8
+        assert R("2 3 pow").eval() == 8
+        assert R("5 0 **").eval() == 1
+        assert R("0 5 **").eval() == 0
+        assert close(R("2 -3 **").eval(), 0.125)
+        assert close(R("4 0.5 **").eval(), 2.0)  # √4
 
     def test_unary_functions_comprehensive(self):
         """Test all unary functions."""
         # Test abs
-        assert RPN("5 abs").eval() == 5
-        assert RPN("-5 abs").eval() == 5
-        assert RPN("0 abs").eval() == 0
+        assert R("5 abs").eval() == 5
+        assert R("-5 abs").eval() == 5
+        assert R("0 abs").eval() == 0
         
         # Test negation
-        assert RPN("5 neg").eval() == -5
-        assert RPN("-5 neg").eval() == 5
-        assert RPN("0 neg").eval() == 0
+        assert R("5 neg").eval() == -5
+        assert R("-5 neg").eval() == 5
+        assert R("0 neg").eval() == 0
         
         # Test sqrt
-        assert RPN("25 sqrt").eval() == 5
-        assert RPN("0 sqrt").eval() == 0
-        assert RPN("2 sqrt").eval() == pytest.approx(math.sqrt(2))
+        assert R("25 sqrt").eval() == 5
+        assert R("0 sqrt").eval() == 0
+        assert close(R("2 sqrt").eval(), SQRT2)
         
         # sqrt of negative should fail
         with pytest.raises(EvaluationError):
-            RPN("-1 sqrt").eval()
+            R("-1 sqrt").eval()
         
         # Test rounding functions
-        assert RPN("3.2 floor").eval() == 3
-        assert RPN("3.7 ceil").eval() == 4
-        assert RPN("3.4 round").eval() == 3
-        assert RPN("3.6 round").eval() == 4
+        assert R("3.2 floor").eval() == 3
+        assert R("3.7 ceil").eval() == 4
+        assert R("3.4 round").eval() == 3
+        assert R("3.6 round").eval() == 4
 
 
 class TestStackOperationsBrutal:
@@ -96,12 +151,12 @@ class TestStackOperationsBrutal:
     def test_dup_edge_cases(self):
         """Test dup with edge cases."""
         # Basic dup
-        assert RPN("5 dup +").eval() == 10
-        assert RPN("0 dup +").eval() == 0
-        assert RPN("-3 dup *").eval() == 9
+        assert R("5 dup +").eval() == 10
+        assert R("0 dup +").eval() == 0
+        assert R("-3 dup *").eval() == 9
         
         # Multiple dups
-        assert RPN("2 dup dup * *").eval() == 8  # 2 * 2 * 2
+        assert R("2 dup dup * *").eval() == 8  # 2 * 2 * 2
         
         # Dup with no stack should fail
         with pytest.raises((ValidationError, EvaluationError)):
@@ -110,15 +165,15 @@ class TestStackOperationsBrutal:
     def test_swap_edge_cases(self):
         """Test swap with edge cases."""
         # Basic swap
-        assert RPN("3 5 swap -").eval() == 2  # 5 - 3
-        assert RPN("10 2 swap /").eval() == pytest.approx(0.2)  # 2 / 10
+        assert R("3 5 swap -").eval() == 2  # 5 - 3
+        assert close(R("10 2 swap /").eval(), 0.2)  # 2 / 10
         
         # Swap identical values
-        assert RPN("7 7 swap +").eval() == 14
+        assert R("7 7 swap +").eval() == 14
         
         # Swap with zero
-        assert RPN("0 5 swap -").eval() == 5  # 5 - 0
-        assert RPN("5 0 swap -").eval() == -5  # 0 - 5
+        assert R("0 5 swap -").eval() == 5  # 5 - 0
+        assert R("5 0 swap -").eval() == -5  # 0 - 5
         
         # Swap with insufficient stack
         with pytest.raises((ValidationError, EvaluationError)):
@@ -129,11 +184,11 @@ class TestStackOperationsBrutal:
     def test_drop_edge_cases(self):
         """Test drop with edge cases."""
         # Basic drop
-        assert RPN("1 2 3 drop +").eval() == 3  # 1 + 2
-        assert RPN("10 20 drop").eval() == 10
+        assert R("1 2 3 drop +").eval() == 3  # 1 + 2
+        assert R("10 20 drop").eval() == 10
         
         # Multiple drops
-        assert RPN("1 2 3 4 drop drop +").eval() == 3  # 1 + 2
+        assert R("1 2 3 4 drop drop +").eval() == 3  # 1 + 2
         
         # Drop with insufficient stack
         with pytest.raises((ValidationError, EvaluationError)):
@@ -143,11 +198,11 @@ class TestStackOperationsBrutal:
         """Test over with edge cases."""
         # Basic over - copies second item to top
         # Stack: 3 4 -> over -> 3 4 3 -> + -> 3 7 -> + -> 10 ✓
-        assert RPN("3 4 over + +").eval() == 10  # 3 + 4 + 3
+        assert R("3 4 over + +").eval() == 10  # 3 + 4 + 3
         
         # Another over test that results in valid expression
         # 10 5 over -> 10 5 10 -> + -> 10 15 -> / -> 10/15 = 0.667
-        assert RPN("10 5 over + /").eval() == pytest.approx(10/15)
+        assert close(R("10 5 over + /").eval(), 10/15)
         
         # Over with insufficient stack
         with pytest.raises((ValidationError, EvaluationError)):
@@ -157,10 +212,10 @@ class TestStackOperationsBrutal:
         """Test rotation with edge cases.""" 
         # Basic rot: a b c -> b c a
         # 1 2 3 rot -> 2 3 1
-        assert RPN("1 2 3 rot + +").eval() == 6  # 2 + 3 + 1
+        assert R("1 2 3 rot + +").eval() == 6  # 2 + 3 + 1
         
         # Rot with identical values
-        assert RPN("5 5 5 rot + +").eval() == 15
+        assert R("5 5 5 rot + +").eval() == 15
         
         # Rot with insufficient stack
         with pytest.raises((ValidationError, EvaluationError)):
@@ -177,28 +232,17 @@ class TestStackOperationsBrutal:
         # + -> 5 3 8
         # + -> 5 11
         # + -> 16
-        assert RPN("5 dup 3 swap over + + +").eval() == 16
+        assert R("5 dup 3 swap over + + +").eval() == 16
 
 
 class TestValidationBrutal:
     """Test validation with every possible invalid case."""
 
-    def test_insufficient_operands(self):
+    @pytest.mark.parametrize("expr", INSUFFICIENT_OPERAND_CASES)
+    def test_insufficient_operands(self, expr):
         """Test all operators with insufficient operands."""
-        binary_ops = ['+', '-', '*', '/', '//', '%', '**', 'pow', 'max', 'min']
-        for op in binary_ops:
-            # No operands
-            with pytest.raises(ValidationError):
-                RPN(f"{op}", strict=True)
-            # One operand  
-            with pytest.raises(ValidationError):
-                RPN(f"5 {op}", strict=True)
-
-        unary_ops = ['abs', 'neg', 'sqrt', 'sin', 'cos', 'tan', 'log', 'ln', 'exp', 'ceil', 'floor', 'round', 'not']
-        for op in unary_ops:
-            # No operands
-            with pytest.raises(ValidationError):
-                RPN(f"{op}", strict=True)
+        with pytest.raises(ValidationError):
+            RPN(expr, strict=True)
 
     def test_too_many_operands(self):
         """Test expressions that leave too many items on stack."""
@@ -212,18 +256,18 @@ class TestValidationBrutal:
     def test_empty_expression_edge_case(self):
         """Test empty expressions."""
         # Empty string should return True according to my implementation
-        result = RPN("").eval()
+        result = R("").eval()
         assert result is True
         
         # Whitespace only
-        result = RPN("   ").eval()
+        result = R("   ").eval()
         assert result is True
 
     def test_malformed_numbers(self):
         """Test malformed number handling."""
         # Multiple dots - should be treated as undefined variable
         with pytest.raises(EvaluationError):
-            RPN("3.14.15").eval()  # Undefined variable
+            R("3.14.15").eval()  # Undefined variable
         
         # But can be provided as variable
         result = RPN("3.14.15").eval(**{"3.14.15": 42})
@@ -231,7 +275,7 @@ class TestValidationBrutal:
         
         # Number-like strings - should be treated as undefined variable
         with pytest.raises(EvaluationError):
-            RPN("123abc").eval()
+            R("123abc").eval()
 
 
 class TestClaimedFeaturesTesting:
@@ -239,30 +283,26 @@ class TestClaimedFeaturesTesting:
 
     def test_expression_addition_detailed(self):
         """Deep test of expression addition (+) operator."""
-        # Valid combination
-        expr1 = RPN("3 4 +")  # Valid
-        expr2 = RPN("2 *", strict=False)  # Invalid alone
-        combined = expr1 + expr2
-        
-        # Should create: [3, 4, '+', 2, '*'] which is actually valid!
+        # Build each fragment exactly once, then exercise all combinations
+        PIECES = {s: RPN(s, strict=False) for s in ("3 4 +", "1 2 +", "3 +", "2 *")}
+
+        # "2 *" is invalid alone but combines into a valid expression
+        combined = PIECES["3 4 +"] + PIECES["2 *"]
         assert combined.tokens == [3, 4, '+', 2, '*']
         assert combined.eval() == 14
-        
-        # Test with valid combination that actually works in RPN
-        e1 = RPN("1 2 +")  # 3 - valid
-        e2 = RPN("3 +", strict=False)  # adds 3 - creates [1,2,+,3,+] = (1+2+3) = 6
-        combined = e1 + e2
+
+        # Valid combination that chains an addition: [1,2,+,3,+] = 6
+        combined = PIECES["1 2 +"] + PIECES["3 +"]
         assert combined.tokens == [1, 2, '+', 3, '+']
         assert combined.eval() == 6
-        
-        # Another valid combination  
-        e3 = RPN("2 *", strict=False)  # multiply by 2
-        combined2 = combined + e3  # Should work now with strict=False preservation
-        assert combined2.tokens == [1, 2, '+', 3, '+', 2, '*'] 
+
+        # Reuse the combined expression rather than re-parsing its parts
+        combined2 = combined + PIECES["2 *"]
+        assert combined2.tokens == [1, 2, '+', 3, '+', 2, '*']
         assert combined2.eval() == 12  # (1+2+3) * 2 = 6 * 2 = 12
-        
+
         # Verify that strict mode is properly preserved
-        assert combined.strict == False  # Should be False since e2 was non-strict
+        assert combined.strict == False  # Should be False since "3 +" was non-strict
         assert combined2.strict == False  # Should be False since both had non-strict
 
     def test_pipe_operator_detailed(self):
@@ -276,7 +316,7 @@ class TestClaimedFeaturesTesting:
         step1 = RPN("2 3 +") | RPN("ans dup *")  # 5 -> 25
         assert step1 == 25
         
-        step2 = RPN("25 1 +").eval()  # 26 (simulating the final step)
+        step2 = R("25 1 +").eval()  # 26 (simulating the final step)
         assert step2 == 26
         
         # Pipe with variables
@@ -293,13 +333,15 @@ class TestClaimedFeaturesTesting:
         expr = RPN("5", strict=False).push(3)
         errors = expr.validate_expression()
         assert len(errors) > 0  # Should have validation errors
-        
-        # But evaluation might still work in some cases
-        try:
-            result = RPN("5", strict=False).push(3).add().eval()
-            assert result == 8  # If it works, should be 5 + 3
-        except ValidationError:
-            pass  # Expected to fail
+
+        # Check validity explicitly instead of catching exceptions, so a
+        # failure can never be silently swallowed
+        chained = RPN("5", strict=False).push(3).add()
+        errors = chained.validate_expression()
+        if not errors:
+            assert chained.eval() == 8  # 5 + 3
+        else:
+            assert any("stack" in e.lower() or "operand" in e.lower() for e in errors)
 
     def test_builder_pattern_vs_method_chaining(self):
         """Compare builder pattern vs method chaining."""
@@ -310,42 +352,56 @@ class TestClaimedFeaturesTesting:
                 .add()
                 .eval())
         assert built == 8
-        
-        # Direct RPN equivalent
-        direct = RPN("5 3 +").eval()
-        assert direct == 8
-        assert built == direct
 
-    def test_template_edge_cases(self):
+        # All construction paths agree; the direct parse comes from the
+        # module-level cache so this costs one parse across the suite
+        assert built == R("5 3 +").eval() == RPN.template("${a} ${b} +").eval(a=5, b=3)
+
+    def test_template_edge_cases(self, template_xy):
         """Test template functionality edge cases."""
         # Basic template
-        template = RPN.template("${x} ${y} +")
-        assert template.eval(x=5, y=3) == 8
-        
+        assert template_xy.eval(x=5, y=3) == 8
+
         # Template with missing variables
         with pytest.raises(EvaluationError):
-            template.eval(x=5)  # Missing y
-        
+            template_xy.eval(x=5)  # Missing y
+
         # Template with extra variables
-        result = template.eval(x=5, y=3, z=100)  # z ignored
+        result = template_xy.eval(x=5, y=3, z=100)  # z ignored
         assert result == 8
 
-    def test_partial_evaluation_edge_cases(self):
+    def test_template_batch(self, template_xy):
+        """Batch-evaluate a template over many bindings, checked against NumPy.
+
+        Today this loops scalar eval() calls; it documents (and will guard)
+        an amortized eval_many-style batch API for the library.
+        """
+        np = pytest.importorskip("numpy")
+
+        xs = np.arange(10_000, dtype=np.int64)
+        ys = xs * 3 + 1
+        expected = xs + ys
+
+        results = [template_xy.eval(x=int(x), y=int(y)) for x, y in zip(xs, ys)]
+        assert np.array_equal(np.asarray(results), expected)
+
+    def test_partial_evaluation_edge_cases(self, xyz_expr):
         """Test partial evaluation edge cases."""
-        expr = RPN("x y + z *")
-        
-        # Partial with one variable
-        partial1 = expr.partial(x=2)
-        assert partial1.eval(y=3, z=4) == 20  # (2+3)*4
-        
-        # Partial with multiple variables
-        partial2 = expr.partial(x=2, y=3)
-        assert partial2.eval(z=4) == 20
-        
-        # Partial with all variables (should still work)
-        partial3 = expr.partial(x=2, y=3, z=4)
-        assert partial3.eval() == 20
-        
+        expr = xyz_expr
+
+        # One partial per binding set, built in a single pass
+        bindings = [{"x": 2}, {"x": 2, "y": 3}, {"x": 2, "y": 3, "z": 4}]
+        partials = {frozenset(kw): expr.partial(**kw) for kw in bindings}
+
+        # Each partial evaluates to 20 given its complementary variables
+        assert partials[frozenset({"x"})].eval(y=3, z=4) == 20  # (2+3)*4
+        assert partials[frozenset({"x", "y"})].eval(z=4) == 20
+        assert partials[frozenset({"x", "y", "z"})].eval() == 20
+
+        # partial() is non-destructive: the token stream is shared unchanged
+        for partial in partials.values():
+            assert partial.tokens == expr.tokens
+
         # Original should be unchanged
         assert expr.eval(x=2, y=3, z=4) == 20
 
@@ -353,45 +409,37 @@ class TestClaimedFeaturesTesting:
 class TestErrorHandlingBrutal:
     """Test every possible error scenario."""
 
-    def test_mathematical_domain_errors_comprehensive(self):
+    @pytest.mark.parametrize("expr", [
+        "-1 sqrt", "-0.1 sqrt",      # square root of negative
+        "0 ln", "-1 ln",             # natural log domain errors
+        "0 log", "-1 log",           # log10 domain errors
+    ])
+    def test_mathematical_domain_errors_comprehensive(self, expr):
         """Test all mathematical domain errors."""
-        # Square root of negative
         with pytest.raises(EvaluationError):
-            RPN("-1 sqrt").eval()
-        with pytest.raises(EvaluationError):
-            RPN("-0.1 sqrt").eval()
-            
-        # Logarithm errors
-        with pytest.raises(EvaluationError):
-            RPN("0 ln").eval()
-        with pytest.raises(EvaluationError):
-            RPN("-1 ln").eval()
-        with pytest.raises(EvaluationError):
-            RPN("0 log").eval()
-        with pytest.raises(EvaluationError):
-            RPN("-1 log").eval()
+            R(expr).eval()
 
     def test_type_conversion_errors(self):
         """Test type-related errors."""
         # Operations on booleans
-        result = RPN("true false and").eval()
+        result = R("true false and").eval()
         assert result is False
         
-        result = RPN("true false or").eval() 
+        result = R("true false or").eval() 
         assert result is True
         
         # sqrt of boolean works in Python (True=1, False=0)
-        result = RPN("true sqrt").eval()
+        result = R("true sqrt").eval()
         assert result == 1.0
         
-        result = RPN("false sqrt").eval()
+        result = R("false sqrt").eval()
         assert result == 0.0
 
     def test_variable_errors_comprehensive(self):
         """Test variable-related errors."""
         # Undefined variable
         with pytest.raises(EvaluationError):
-            RPN("undefined_var").eval()
+            R("undefined_var").eval()
         
         # Variable shadowing constants
         result = RPN("pi").eval(pi=3.0)  # Should use provided value
@@ -401,52 +449,65 @@ class TestErrorHandlingBrutal:
         result = RPN("x").eval(**{"": 5, "x": 10})
         assert result == 10
 
-    def test_stack_operation_errors_comprehensive(self):
+    @pytest.mark.parametrize("expr", STACK_UNDERFLOW_CASES)
+    def test_stack_operation_errors_comprehensive(self, expr):
         """Test all stack operation error cases."""
-        stack_ops = ['dup', 'swap', 'drop', 'over', 'rot']
-        
-        # Test each with empty stack
-        for op in stack_ops:
-            with pytest.raises((ValidationError, EvaluationError)):
-                RPN(f"{op}", strict=False).eval()
-        
-        # Test operations requiring 2+ items with only 1 item
-        for op in ['swap', 'over']:
-            with pytest.raises((ValidationError, EvaluationError)):
-                RPN(f"5 {op}", strict=False).eval()
-        
-        # Test rot requiring 3+ items with only 1-2 items
         with pytest.raises((ValidationError, EvaluationError)):
-            RPN("5 rot", strict=False).eval()
-        with pytest.raises((ValidationError, EvaluationError)):
-            RPN("5 6 rot", strict=False).eval()
+            RPN(expr, strict=False).eval()
 
 
 class TestComplexExpressionsBrutal:
     """Test complex expressions that might break the system."""
 
-    def test_deeply_nested_expressions(self):
+    @pytest.mark.parametrize("depth", [10, 100, 1000])
+    def test_deeply_nested_expressions(self, depth):
         """Test very deeply nested expressions."""
-        # Create: 1+1+1+1+1+1+1+1+1+1 (10 ones)
-        expr = "1 " + "1 + " * 9
+        # Chained additions: 1+1+...+1 (depth ones), built with a single join
+        expr = " ".join(["1"] + ["1 +"] * (depth - 1))
         result = RPN(expr).eval()
-        assert result == 10
-        
-        # Nested multiplications: 2*2*2*2*2 = 32
-        expr = "2 " + "2 * " * 4
+        assert result == depth
+
+        # Chained multiplications: 2*2*...*2 (depth twos)
+        expr = " ".join(["2"] + ["2 *"] * (depth - 1))
         result = RPN(expr).eval()
-        assert result == 32
+        assert result == 2 ** depth
 
     def test_mixed_stack_and_arithmetic(self):
         """Test mixing stack operations with arithmetic."""
         # Complex: duplicate, add, swap with another number, multiply
-        result = RPN("5 dup + 3 swap *").eval()  # (5+5) * 3 = 30
+        result = R("5 dup + 3 swap *").eval()  # (5+5) * 3 = 30
         assert result == 30
         
         # Stack dance with multiple operations
-        result = RPN("2 3 4 rot + *").eval()  # 2 3 4 -> 3 4 2 -> 3 6 -> 18
+        result = R("2 3 4 rot + *").eval()  # 2 3 4 -> 3 4 2 -> 3 6 -> 18
         assert result == 18
 
+    def test_stack_ops_match_reference(self):
+        """Fuzz random stack-op sequences against a reference interpreter."""
+        rng = random.Random(0x5EED)
+
+        def reference(nums, ops):
+            stack = list(nums)
+            for op in ops:
+                if op == "dup":
+                    stack.append(stack[-1])
+                elif op == "swap":
+                    stack[-1], stack[-2] = stack[-2], stack[-1]
+                elif op == "over":
+                    stack.append(stack[-2])
+                elif op == "rot":
+                    stack[-3:] = [stack[-2], stack[-1], stack[-3]]
+            return stack[-1]  # top of stack, matching HP-style eval
+
+        # Seeding four numbers keeps every generated sequence valid, so each
+        # iteration is a real assertion rather than an early return
+        for _ in range(200):
+            nums = [rng.randint(-10, 10) for _ in range(4)]
+            ops = [rng.choice(("dup", "swap", "over", "rot"))
+                   for _ in range(rng.randint(1, 8))]
+            expr = " ".join(map(str, nums + ops))
+            assert RPN(expr, strict=False).eval() == reference(nums, ops)
+
     def test_scientific_calculations(self):
         """Test real-world scientific calculations."""
         # Distance formula: √((x2-x1)² + (y2-y1)²)
@@ -460,14 +521,31 @@ class TestComplexExpressionsBrutal:
         # -b = -(-5) = 5, b² = (-5)² = 25, 4ac = 4*1*6 = 24
         expr = "5 5 dup * 4 1 * 6 * - sqrt + 2 1 * /"
         result = RPN(expr).eval() 
-        assert result == pytest.approx(3.0)  # Should be 3
+        assert close(result, 3.0)  # Should be 3
         
         # Compound interest formula: P(1 + r/n)^(nt)
         # $1000 at 5% yearly, compounded monthly for 2 years
         expr = "1 0.05 12 / + 12 2 * pow 1000 *"
         result = RPN(expr).eval()
-        expected = 1000 * (1 + 0.05/12) ** (12*2)
-        assert result == pytest.approx(expected, rel=1e-6)
+        assert result == pytest.approx(EXPECTED_CI, rel=1e-6)
+
+    def test_compound_interest_sweep(self):
+        """Parametric compound-interest sweep validated against NumPy."""
+        np = pytest.importorskip("numpy")
+
+        P = np.array([1000.0, 5000.0])
+        r = np.array([0.03, 0.05, 0.07])
+        n = np.array([12.0])
+        t = np.array([1.0, 2.0, 5.0])
+        PP, rr, nn, tt = np.meshgrid(P, r, n, t, indexing='ij')
+        # Expected values computed once via a single NumPy broadcast
+        expected = PP * (1 + rr / nn) ** (nn * tt)
+
+        template = RPN.template("1 ${r} ${n} / + ${n} ${t} * pow ${P} *")
+        for idx in np.ndindex(expected.shape):
+            got = template.eval(P=float(PP[idx]), r=float(rr[idx]),
+                                n=float(nn[idx]), t=float(tt[idx]))
+            assert close(got, float(expected[idx]))
 
     def test_boolean_logic_chains(self):
         """Test complex boolean logic."""
@@ -482,56 +560,61 @@ class TestComplexExpressionsBrutal:
         assert result is True  # NOT (False OR False) = NOT False = True
 
 
+# Shared metadata fixture data -- built once at module load
+_METADATA = {
+    "author": "test",
+    "version": 1.0,
+    "tags": ["math", "calculation"],
+    "nested": {"deep": {"value": 42}}
+}
+
+
+@pytest.fixture(scope="session")
+def metadata_json_str():
+    """Serialized expression with complex metadata, built once per session."""
+    return RPN("3 4 +", metadata=_METADATA).to_json()
+
+
 class TestSerializationBrutal:
     """Test serialization edge cases that might break."""
 
-    def test_json_with_complex_metadata(self):
+    def test_json_with_complex_metadata(self, metadata_json_str):
         """Test JSON with complex metadata."""
-        metadata = {
-            "author": "test",
-            "version": 1.0,
-            "tags": ["math", "calculation"],
-            "nested": {"deep": {"value": 42}}
-        }
-        expr = RPN("3 4 +", metadata=metadata)
-        
-        json_str = expr.to_json()
-        restored = RPN.from_json(json_str)
-        
-        assert restored.metadata == metadata
+        restored = RPN.from_json(metadata_json_str)
+
+        assert restored.metadata == _METADATA
         assert restored.eval() == 7
 
+    def test_json_metadata_orjson_roundtrip(self):
+        """Compare the metadata round-trip against orjson when available."""
+        orjson = pytest.importorskip("orjson")
+        assert orjson.loads(orjson.dumps(_METADATA)) == _METADATA
+
     def test_json_with_special_tokens(self):
         """Test JSON with special token values."""
         # Test with various token types
         expr = RPN([3.14159, -42, 0, "pi", "+", "sqrt"], strict=False)
         
         json_str = expr.to_json()
-        data = json.loads(json_str)
-        
-        # All tokens should be JSON-serializable
-        assert all(isinstance(token, (str, int, float)) for token in data["tokens"])
-
-    def test_infix_conversion_complex(self):
+        data = _loads(json_str)
+        
+        # All tokens should be JSON-serializable: one C-level pass over the
+        # types instead of a Python-level isinstance per token
+        assert set(map(type, data["tokens"])).issubset({str, int, float, bool})
+
+    @pytest.mark.parametrize("rpn_expr,expected", [
+        ("3 4 +", {"3", "4", "+"}),
+        ("5 neg", {"-", "5"}),
+        ("25 sqrt", {"sqrt", "25"}),
+        ("3 4 + 2 *", {"3", "4", "+", "2", "*"}),
+        ("x y + z *", {"x", "y", "z"}),
+    ])
+    def test_infix_conversion_complex(self, rpn_expr, expected):
         """Test infix conversion with complex cases."""
-        test_cases = [
-            # (RPN, should_contain_elements)
-            ("3 4 +", ["3", "4", "+"]),
-            ("5 neg", ["-", "5"]),
-            ("25 sqrt", ["sqrt", "25"]),
-            ("3 4 + 2 *", ["3", "4", "+", "2", "*"]),
-            ("x y + z *", ["x", "y", "z"]),
-        ]
-        
-        for rpn_expr, should_contain in test_cases:
-            try:
-                infix = RPN(rpn_expr).to_infix()
-                # Just verify it doesn't crash and contains expected elements
-                for element in should_contain:
-                    if element not in "()[]":
-                        assert element in infix or element.replace("*", "*") in infix
-            except Exception as e:
-                pytest.fail(f"Infix conversion failed for '{rpn_expr}': {e}")
+        infix = R(rpn_expr).to_infix()
+        # Tokenize once and compare as sets rather than scanning per substring
+        tokens = set(re.findall(r"[A-Za-z_]\w*|\d+(?:\.\d+)?|[+\-*/]", infix))
+        assert expected.issubset(tokens)
 
 
 if __name__ == "__main__":
@@ -32,6 +32,11 @@ class TestRPNBasics:
         expr = RPN("3 4 +")
         assert expr() == 7  # __call__ shorthand
     
+    def test_precompile(self):
+        expr = RPN("3 4 +")
+        assert expr.precompile() is expr
+        assert expr.eval() == 7
+
     def test_string_representation(self):
         expr = RPN("3 4 +")
         assert str(expr) == "3 4 +"
@@ -238,6 +243,61 @@ class TestConversion:
         assert "3" in infix and "4" in infix and "+" in infix and "*" in infix
 
 
+class TestBatchEvaluation:
+    """Test NumPy-vectorized batch evaluation."""
+
+    def test_eval_batch_basic(self):
+        pytest.importorskip("numpy")
+        result = RPN("x 2 * y +").eval_batch(x=[1, 2, 3], y=[10, 20, 30])
+        assert result.tolist() == [12, 24, 36]
+
+    def test_eval_batch_matches_scalar_eval(self):
+        np = pytest.importorskip("numpy")
+        expr = RPN("x dup * y dup * + sqrt")
+        xs = np.arange(1.0, 6.0)
+        ys = np.arange(2.0, 7.0)
+        batch = expr.eval_batch(x=xs, y=ys)
+        for x, y, result in zip(xs, ys, batch):
+            assert result == pytest.approx(expr.eval(x=x, y=y))
+
+    def test_eval_batch_constant_broadcast(self):
+        pytest.importorskip("numpy")
+        result = RPN("pi").eval_batch(x=[0, 0, 0])
+        assert result.shape == (3,)
+        assert result[0] == pytest.approx(math.pi)
+
+
+class TestJit:
+    """Test the specialized-function compiler."""
+
+    def test_jit_basic(self):
+        f = RPN("x 2 * y +").jit()
+        assert f(x=5, y=3) == 13
+
+    def test_jit_constants_and_defaults(self):
+        f = RPN("x y +", defaults={"x": 3}).jit()
+        assert f(y=4) == 7
+        assert f(x=10, y=4) == 14
+        assert RPN("pi").jit()() == pytest.approx(math.pi)
+
+    def test_jit_non_literal_defaults(self):
+        # Regression: inf/nan defaults used to raise NameError at compile
+        f = RPN("x 1 +", defaults={"x": math.inf}).jit()
+        assert f() == math.inf
+        assert f(x=2) == 3
+
+    def test_jit_temp_name_collision(self):
+        # Regression: variables spelled like CSE temps were shadowed by
+        # the generated _tN assignments
+        f = RPN("_t0 _t0 * _t0 +").jit()
+        assert f(_t0=2) == 6
+
+    def test_jit_falls_back_to_eval(self):
+        # Stack ops can't be expressed as a straight-line function
+        expr = RPN("5 dup +")
+        assert expr.jit()() == 10
+
+
 class TestRPNBuilder:
     """Test the fluent builder interface."""
     
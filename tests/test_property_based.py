@@ -0,0 +1,73 @@
+"""Property-based tests, split out so hypothesis only imports when they run."""
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, strategies as st, assume, settings
+from hypothesis.strategies import composite
+
+from tests.test_comprehensive import _eval_const_str
+
+
+class TestPropertyBased:
+    """Property-based testing with hypothesis."""
+
+    @composite
+    def rpn_arithmetic_expression(draw):
+        """Generate valid arithmetic RPN expressions."""
+        # Start with 2 numbers
+        a = draw(st.integers(min_value=-100, max_value=100))
+        b = draw(st.integers(min_value=1, max_value=100))  # Avoid division by zero
+        op = draw(st.sampled_from(['+', '-', '*', '//', '%']))
+        return f"{a} {b} {op}", a, b, op
+
+    @given(rpn_arithmetic_expression())
+    @settings(max_examples=100)
+    def test_arithmetic_properties(self, expr_data):
+        """Test arithmetic operations satisfy basic properties."""
+        expr, a, b, op = expr_data
+        result = _eval_const_str(expr)
+
+        # Test basic sanity
+        assert isinstance(result, (int, float))
+
+        # Test specific operation properties
+        if op == '+':
+            assert result == a + b
+            # Test commutativity
+            commutative = _eval_const_str(f"{b} {a} +")
+            assert result == commutative
+        elif op == '-':
+            assert result == a - b
+        elif op == '*':
+            assert result == a * b
+            # Test commutativity
+            commutative = _eval_const_str(f"{b} {a} *")
+            assert result == commutative
+
+    @given(st.integers(min_value=1, max_value=1000))
+    @settings(max_examples=50)
+    def test_dup_property(self, value):
+        """Property: x dup + should equal x * 2."""
+        result = _eval_const_str(f"{value} dup +")
+        assert result == value * 2
+
+    @given(st.integers(min_value=1, max_value=100), st.integers(min_value=1, max_value=100))
+    @settings(max_examples=50)
+    def test_swap_property(self, a, b):
+        """Property: a b swap should put a on top, b on bottom."""
+        result = _eval_const_str(f"{a} {b} swap drop")  # Drop top element (a), leaving b
+        assert result == b
+
+    @given(st.floats(min_value=0, max_value=100, allow_nan=False, allow_infinity=False))
+    @settings(max_examples=30)
+    def test_sqrt_property(self, value):
+        """Property: sqrt(x)² ≈ x for positive x."""
+        assume(value >= 0)
+        result = _eval_const_str(f"{value} sqrt dup *")
+        assert result == pytest.approx(value, rel=1e-10)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])